@@ -17,6 +17,8 @@ LogReader:
 
 import re
 import os
+import mmap
+import bisect
 import datetime
 import time
 import platform
@@ -38,124 +40,150 @@ _logLanguageRegex = {
         'character': "(?<=Listener: ).*",
         'sessionTime': "(?<=Session Started: ).*",
         'pilotAndWeapon': '(?:.*ffffffff>(?P<default_pilot>[^\(\)<>]*)(?:\[.*\((?P<default_ship>.*)\)<|<)/b.*> \-(?: (?P<default_weapon>.*?)(?: \-|<)|.*))',
-        'damageOut': "\(combat\) <.*?><b>([0-9]+).*>to<",
-        'damageIn': "\(combat\) <.*?><b>([0-9]+).*>from<",
-        'armorRepairedOut': "\(combat\) <.*?><b>([0-9]+).*> remote armor repaired to <",
-        'hullRepairedOut': "\(combat\) <.*?><b>([0-9]+).*> remote hull repaired to <",
-        'shieldBoostedOut': "\(combat\) <.*?><b>([0-9]+).*> remote shield boosted to <",
-        'armorRepairedIn': "\(combat\) <.*?><b>([0-9]+).*> remote armor repaired by <",
-        'hullRepairedIn': "\(combat\) <.*?><b>([0-9]+).*> remote hull repaired by <",
-        'shieldBoostedIn': "\(combat\) <.*?><b>([0-9]+).*> remote shield boosted by <",
-        'capTransferedOut': "\(combat\) <.*?><b>([0-9]+).*> remote capacitor transmitted to <",
-        'capNeutralizedOut': "\(combat\) <.*?ff7fffff><b>([0-9]+).*> energy neutralized <",
-        'nosRecieved': "\(combat\) <.*?><b>\+([0-9]+).*> energy drained from <",
-        'capTransferedIn': "\(combat\) <.*?><b>([0-9]+).*> remote capacitor transmitted by <",
-        'capNeutralizedIn': "\(combat\) <.*?ffe57f7f><b>([0-9]+).*> energy neutralized <",
-        'nosTaken': "\(combat\) <.*?><b>\-([0-9]+).*> energy drained to <",
+        'damageOut': "\(combat\) <[^>]*><b>([0-9]+).*>to<",
+        'damageIn': "\(combat\) <[^>]*><b>([0-9]+).*>from<",
+        'armorRepairedOut': "\(combat\) <[^>]*><b>([0-9]+).*> remote armor repaired to <",
+        'hullRepairedOut': "\(combat\) <[^>]*><b>([0-9]+).*> remote hull repaired to <",
+        'shieldBoostedOut': "\(combat\) <[^>]*><b>([0-9]+).*> remote shield boosted to <",
+        'armorRepairedIn': "\(combat\) <[^>]*><b>([0-9]+).*> remote armor repaired by <",
+        'hullRepairedIn': "\(combat\) <[^>]*><b>([0-9]+).*> remote hull repaired by <",
+        'shieldBoostedIn': "\(combat\) <[^>]*><b>([0-9]+).*> remote shield boosted by <",
+        'capTransferedOut': "\(combat\) <[^>]*><b>([0-9]+).*> remote capacitor transmitted to <",
+        'capNeutralizedOut': "\(combat\) <[^>]*ff7fffff><b>([0-9]+).*> energy neutralized <",
+        'nosRecieved': "\(combat\) <[^>]*><b>\+([0-9]+).*> energy drained from <",
+        'capTransferedIn': "\(combat\) <[^>]*><b>([0-9]+).*> remote capacitor transmitted by <",
+        'capNeutralizedIn': "\(combat\) <[^>]*ffe57f7f><b>([0-9]+).*> energy neutralized <",
+        'nosTaken': "\(combat\) <[^>]*><b>\-([0-9]+).*> energy drained to <",
         'mined': "\(mining\) .* <b><.*?><.*?>([0-9]+).*> units of .*<b>(.+)</b>"
     },
     'russian': {
         'character': "(?<=Слушатель: ).*",
         'sessionTime': "(?<=Сеанс начат: ).*",
         'pilotAndWeapon': '(?:.*ffffffff>(?:<localized .*?>)?(?P<default_pilot>[^\(\)<>]*)(?:\[.*\((?:<localized .*?>)?(?P<default_ship>.*)\)<|<)/b.*> \-(?: (?:<localized .*?>)?(?P<default_weapon>.*?)(?: \-|<)|.*))',
-        'damageOut': "\(combat\) <.*?><b>([0-9]+).*>на<",
-        'damageIn': "\(combat\) <.*?><b>([0-9]+).*>из<",
-        'armorRepairedOut': "\(combat\) <.*?><b>([0-9]+).*> единиц запаса прочности брони отремонтировано <",
-        'hullRepairedOut': "\(combat\) <.*?><b>([0-9]+).*> единиц запаса прочности корпуса отремонтировано <",
-        'shieldBoostedOut': "\(combat\) <.*?><b>([0-9]+).*> единиц запаса прочности щитов накачано <",
-        'armorRepairedIn': "\(combat\) <.*?><b>([0-9]+).*> единиц запаса прочности брони получено дистанционным ремонтом от <",
-        'hullRepairedIn': "\(combat\) <.*?><b>([0-9]+).*> единиц запаса прочности корпуса получено дистанционным ремонтом от <",
-        'shieldBoostedIn': "\(combat\) <.*?><b>([0-9]+).*> единиц запаса прочности щитов получено накачкой от <",
-        'capTransferedOut': "\(combat\) <.*?><b>([0-9]+).*> единиц запаса энергии накопителя отправлено в <",
-        'capNeutralizedOut': "\(combat\) <.*?ff7fffff><b>([0-9]+).*> энергии нейтрализовано <",
-        'nosRecieved': "\(combat\) <.*?><b>\+([0-9]+).*> энергии извлечено из <",
-        'capTransferedIn': "\(combat\) <.*?><b>([0-9]+).*> единиц запаса энергии накопителя получено от <",
-        'capNeutralizedIn': "\(combat\) <.*?ffe57f7f><b>([0-9]+).*> энергии нейтрализовано <",
-        'nosTaken': "\(combat\) <.*?><b>\-([0-9]+).*> энергии извлечено и передано <",
+        'damageOut': "\(combat\) <[^>]*><b>([0-9]+).*>на<",
+        'damageIn': "\(combat\) <[^>]*><b>([0-9]+).*>из<",
+        'armorRepairedOut': "\(combat\) <[^>]*><b>([0-9]+).*> единиц запаса прочности брони отремонтировано <",
+        'hullRepairedOut': "\(combat\) <[^>]*><b>([0-9]+).*> единиц запаса прочности корпуса отремонтировано <",
+        'shieldBoostedOut': "\(combat\) <[^>]*><b>([0-9]+).*> единиц запаса прочности щитов накачано <",
+        'armorRepairedIn': "\(combat\) <[^>]*><b>([0-9]+).*> единиц запаса прочности брони получено дистанционным ремонтом от <",
+        'hullRepairedIn': "\(combat\) <[^>]*><b>([0-9]+).*> единиц запаса прочности корпуса получено дистанционным ремонтом от <",
+        'shieldBoostedIn': "\(combat\) <[^>]*><b>([0-9]+).*> единиц запаса прочности щитов получено накачкой от <",
+        'capTransferedOut': "\(combat\) <[^>]*><b>([0-9]+).*> единиц запаса энергии накопителя отправлено в <",
+        'capNeutralizedOut': "\(combat\) <[^>]*ff7fffff><b>([0-9]+).*> энергии нейтрализовано <",
+        'nosRecieved': "\(combat\) <[^>]*><b>\+([0-9]+).*> энергии извлечено из <",
+        'capTransferedIn': "\(combat\) <[^>]*><b>([0-9]+).*> единиц запаса энергии накопителя получено от <",
+        'capNeutralizedIn': "\(combat\) <[^>]*ffe57f7f><b>([0-9]+).*> энергии нейтрализовано <",
+        'nosTaken': "\(combat\) <[^>]*><b>\-([0-9]+).*> энергии извлечено и передано <",
         'mined': "\(mining\) .* <b><.*?><.*?>([0-9]+).*<b>(?:<localized .*?>)?(.+)\*</b>"
     },
     'french': {
         'character': "(?<=Auditeur: ).*",
         'sessionTime': "(?<=Session commencée: ).*",
         'pilotAndWeapon': '(?:.*ffffffff>(?:<localized .*?>)?(?P<default_pilot>[^\(\)<>]*)(?:\[.*\((?:<localized .*?>)?(?P<default_ship>.*)\)<|<)/b.*> \-(?: (?:<localized .*?>)?(?P<default_weapon>.*?)(?: \-|<)|.*))',
-        'damageOut': "\(combat\) <.*?><b>([0-9]+).*>à<",
-        'damageIn': "\(combat\) <.*?><b>([0-9]+).*>de<",
-        'armorRepairedOut': "\(combat\) <.*?><b>([0-9]+).*> points de blindage transférés à distance à <",
-        'hullRepairedOut': "\(combat\) <.*?><b>([0-9]+).*> points de structure transférés à distance à <",
-        'shieldBoostedOut': "\(combat\) <.*?><b>([0-9]+).*> points de boucliers transférés à distance à <",
-        'armorRepairedIn': "\(combat\) <.*?><b>([0-9]+).*> points de blindage réparés à distance par <",
-        'hullRepairedIn': "\(combat\) <.*?><b>([0-9]+).*> points de structure réparés à distance par <",
-        'shieldBoostedIn': "\(combat\) <.*?><b>([0-9]+).*> points de boucliers transférés à distance par <",
-        'capTransferedOut': "\(combat\) <.*?><b>([0-9]+).*> points de capaciteur transférés à distance à <",
-        'capNeutralizedOut': "\(combat\) <.*?ff7fffff><b>([0-9]+).*> d'énergie neutralisée en faveur de <",
-        'nosRecieved': "\(combat\) <.*?><b>([0-9]+).*> d'énergie siphonnée aux dépens de <",
-        'capTransferedIn': "\(combat\) <.*?><b>([0-9]+).*> points de capaciteur transférés à distance par <",
-        'capNeutralizedIn': "\(combat\) <.*?ffe57f7f><b>([0-9]+).*> d'énergie neutralisée aux dépens de <",
-        'nosTaken': "\(combat\) <.*?><b>([0-9]+).*> d'énergie siphonnée en faveur de <",
+        'damageOut': "\(combat\) <[^>]*><b>([0-9]+).*>à<",
+        'damageIn': "\(combat\) <[^>]*><b>([0-9]+).*>de<",
+        'armorRepairedOut': "\(combat\) <[^>]*><b>([0-9]+).*> points de blindage transférés à distance à <",
+        'hullRepairedOut': "\(combat\) <[^>]*><b>([0-9]+).*> points de structure transférés à distance à <",
+        'shieldBoostedOut': "\(combat\) <[^>]*><b>([0-9]+).*> points de boucliers transférés à distance à <",
+        'armorRepairedIn': "\(combat\) <[^>]*><b>([0-9]+).*> points de blindage réparés à distance par <",
+        'hullRepairedIn': "\(combat\) <[^>]*><b>([0-9]+).*> points de structure réparés à distance par <",
+        'shieldBoostedIn': "\(combat\) <[^>]*><b>([0-9]+).*> points de boucliers transférés à distance par <",
+        'capTransferedOut': "\(combat\) <[^>]*><b>([0-9]+).*> points de capaciteur transférés à distance à <",
+        'capNeutralizedOut': "\(combat\) <[^>]*ff7fffff><b>([0-9]+).*> d'énergie neutralisée en faveur de <",
+        'nosRecieved': "\(combat\) <[^>]*><b>([0-9]+).*> d'énergie siphonnée aux dépens de <",
+        'capTransferedIn': "\(combat\) <[^>]*><b>([0-9]+).*> points de capaciteur transférés à distance par <",
+        'capNeutralizedIn': "\(combat\) <[^>]*ffe57f7f><b>([0-9]+).*> d'énergie neutralisée aux dépens de <",
+        'nosTaken': "\(combat\) <[^>]*><b>([0-9]+).*> d'énergie siphonnée en faveur de <",
         'mined': "\(mining\) .* <b><.*?><.*?>([0-9]+).*<b>(?:<localized .*?>)?(.+)\*</b>"
     },
     'german': {
         'character': "(?<=Empfänger: ).*",
         'sessionTime': "(?<=Sitzung gestartet: ).*",
         'pilotAndWeapon': '(?:.*ffffffff>(?:<localized .*?>)?(?P<default_pilot>[^\(\)<>]*)(?:\[.*\((?:<localized .*?>)?(?P<default_ship>.*)\)<|<)/b.*> \-(?: (?:<localized .*?>)?(?P<default_weapon>.*?)(?: \-|<)|.*))',
-        'damageOut': "\(combat\) <.*?><b>([0-9]+).*>nach<",
-        'damageIn': "\(combat\) <.*?><b>([0-9]+).*>von<",
-        'armorRepairedOut': "\(combat\) <.*?><b>([0-9]+).*> Panzerungs-Fernreparatur zu <",
-        'hullRepairedOut': "\(combat\) <.*?><b>([0-9]+).*> Rumpf-Fernreparatur zu <",
-        'shieldBoostedOut': "\(combat\) <.*?><b>([0-9]+).*> Schildfernbooster aktiviert zu <",
-        'armorRepairedIn': "\(combat\) <.*?><b>([0-9]+).*> Panzerungs-Fernreparatur von <",
-        'hullRepairedIn': "\(combat\) <.*?><b>([0-9]+).*> Rumpf-Fernreparatur von <",
-        'shieldBoostedIn': "\(combat\) <.*?><b>([0-9]+).*> Schildfernbooster aktiviert von <",
-        'capTransferedOut': "\(combat\) <.*?><b>([0-9]+).*> Fernenergiespeicher übertragen zu <",
-        'capNeutralizedOut': "\(combat\) <.*?ff7fffff><b>([0-9]+).*> Energie neutralisiert <",
-        'nosRecieved': "\(combat\) <.*?><b>\+([0-9]+).*> Energie transferiert von <",
-        'capTransferedIn': "\(combat\) <.*?><b>([0-9]+).*> Fernenergiespeicher übertragen von <",
-        'capNeutralizedIn': "\(combat\) <.*?ffe57f7f><b>\-([0-9]+).*> Energie neutralisiert <",
-        'nosTaken': "\(combat\) <.*?><b>\-([0-9]+).*> Energie transferiert zu <",
+        'damageOut': "\(combat\) <[^>]*><b>([0-9]+).*>nach<",
+        'damageIn': "\(combat\) <[^>]*><b>([0-9]+).*>von<",
+        'armorRepairedOut': "\(combat\) <[^>]*><b>([0-9]+).*> Panzerungs-Fernreparatur zu <",
+        'hullRepairedOut': "\(combat\) <[^>]*><b>([0-9]+).*> Rumpf-Fernreparatur zu <",
+        'shieldBoostedOut': "\(combat\) <[^>]*><b>([0-9]+).*> Schildfernbooster aktiviert zu <",
+        'armorRepairedIn': "\(combat\) <[^>]*><b>([0-9]+).*> Panzerungs-Fernreparatur von <",
+        'hullRepairedIn': "\(combat\) <[^>]*><b>([0-9]+).*> Rumpf-Fernreparatur von <",
+        'shieldBoostedIn': "\(combat\) <[^>]*><b>([0-9]+).*> Schildfernbooster aktiviert von <",
+        'capTransferedOut': "\(combat\) <[^>]*><b>([0-9]+).*> Fernenergiespeicher übertragen zu <",
+        'capNeutralizedOut': "\(combat\) <[^>]*ff7fffff><b>([0-9]+).*> Energie neutralisiert <",
+        'nosRecieved': "\(combat\) <[^>]*><b>\+([0-9]+).*> Energie transferiert von <",
+        'capTransferedIn': "\(combat\) <[^>]*><b>([0-9]+).*> Fernenergiespeicher übertragen von <",
+        'capNeutralizedIn': "\(combat\) <[^>]*ffe57f7f><b>\-([0-9]+).*> Energie neutralisiert <",
+        'nosTaken': "\(combat\) <[^>]*><b>\-([0-9]+).*> Energie transferiert zu <",
         'mined': "\(mining\) .* <b><.*?><.*?>([0-9]+).*<b>(?:<localized .*?>)?(.+)\*</b>"
     },
     'japanese': {
         'character': "(?<=傍聴者: ).*",
         'sessionTime': "(?<=セッション開始: ).*",
         'pilotAndWeapon': '(?:.*ffffffff>(?:<localized .*?>)?(?P<default_pilot>[^\(\)<>]*)(?:\[.*\((?:<localized .*?>)?(?P<default_ship>.*)\)<|<)/b.*> \-(?: (?:<localized .*?>)?(?P<default_weapon>.*?)(?: \-|<)|.*))',
-        'damageOut': "\(combat\) <.*?><b>([0-9]+).*>対象:<",
-        'damageIn': "\(combat\) <.*?><b>([0-9]+).*>攻撃者:<",
-        'armorRepairedOut': "\(combat\) <.*?><b>([0-9]+).*> remote armor repaired to <",
-        'hullRepairedOut': "\(combat\) <.*?><b>([0-9]+).*> remote hull repaired to <",
-        'shieldBoostedOut': "\(combat\) <.*?><b>([0-9]+).*> remote shield boosted to <",
-        'armorRepairedIn': "\(combat\) <.*?><b>([0-9]+).*> remote armor repaired by <",
-        'hullRepairedIn': "\(combat\) <.*?><b>([0-9]+).*> remote hull repaired by <",
-        'shieldBoostedIn': "\(combat\) <.*?><b>([0-9]+).*> remote shield boosted by <",
-        'capTransferedOut': "\(combat\) <.*?><b>([0-9]+).*> remote capacitor transmitted to <",
-        'capNeutralizedOut': "\(combat\) <.*?ff7fffff><b>([0-9]+).*> エネルギーニュートラライズ 対象:<",
-        'nosRecieved': "\(combat\) <.*?><b>\+([0-9]+).*> エネルギードレイン 対象:<",
-        'capTransferedIn': "\(combat\) <.*?><b>([0-9]+).*> remote capacitor transmitted by <",
-        'capNeutralizedIn': "\(combat\) <.*?ffe57f7f><b>([0-9]+).*>のエネルギーが解放されました<",
-        'nosTaken': "\(combat\) <.*?><b>\-([0-9]+).*> エネルギードレイン 攻撃者:<",
+        'damageOut': "\(combat\) <[^>]*><b>([0-9]+).*>対象:<",
+        'damageIn': "\(combat\) <[^>]*><b>([0-9]+).*>攻撃者:<",
+        'armorRepairedOut': "\(combat\) <[^>]*><b>([0-9]+).*> remote armor repaired to <",
+        'hullRepairedOut': "\(combat\) <[^>]*><b>([0-9]+).*> remote hull repaired to <",
+        'shieldBoostedOut': "\(combat\) <[^>]*><b>([0-9]+).*> remote shield boosted to <",
+        'armorRepairedIn': "\(combat\) <[^>]*><b>([0-9]+).*> remote armor repaired by <",
+        'hullRepairedIn': "\(combat\) <[^>]*><b>([0-9]+).*> remote hull repaired by <",
+        'shieldBoostedIn': "\(combat\) <[^>]*><b>([0-9]+).*> remote shield boosted by <",
+        'capTransferedOut': "\(combat\) <[^>]*><b>([0-9]+).*> remote capacitor transmitted to <",
+        'capNeutralizedOut': "\(combat\) <[^>]*ff7fffff><b>([0-9]+).*> エネルギーニュートラライズ 対象:<",
+        'nosRecieved': "\(combat\) <[^>]*><b>\+([0-9]+).*> エネルギードレイン 対象:<",
+        'capTransferedIn': "\(combat\) <[^>]*><b>([0-9]+).*> remote capacitor transmitted by <",
+        'capNeutralizedIn': "\(combat\) <[^>]*ffe57f7f><b>([0-9]+).*>のエネルギーが解放されました<",
+        'nosTaken': "\(combat\) <[^>]*><b>\-([0-9]+).*> エネルギードレイン 攻撃者:<",
         'mined': "\(mining\) .* <b><.*?><.*?>([0-9]+).*<b>(?:<localized .*?>)?(.+)\*</b>"
     },
     'chinese':{
         'character': "(?<=收听者: ).*",
         'sessionTime': "(?<=进程开始: ).*",
         'pilotAndWeapon': '(?:.*ffffffff>(?:<localized .*?>)?(?P<default_pilot>[^\(\)<>]*)(?:\[.*\((?:<localized .*?>)?(?P<default_ship>.*)\)<|<)/b.*> \-(?: (?:<localized .*?>)?(?P<default_weapon>.*?)(?: \-|<)|.*))',
-        'damageOut': "\(combat\) <.*?><b>([0-9]+).*>对<",
-        'damageIn': "\(combat\) <.*?><b>([0-9]+).*>来自<",
-        'armorRepairedOut': "\(combat\) <.*?><b>([0-9]+).*>远程装甲维修量至<",
-        'hullRepairedOut': "\(combat\) <.*?><b>([0-9]+).*>远程结构维修量至<",
-        'shieldBoostedOut': "\(combat\) <.*?><b>([0-9]+).*>远程护盾回充增量至<",
-        'armorRepairedIn': "\(combat\) <.*?><b>([0-9]+).*>远程装甲维修量由<",
-        'hullRepairedIn': "\(combat\) <.*?><b>([0-9]+).*>远程结构维修量由<",
-        'shieldBoostedIn': "\(combat\) <.*?><b>([0-9]+).*>远程护盾回充增量由<",
-        'capTransferedOut': "\(combat\) <.*?><b>([0-9]+).*>远程电容传输至<",
-        'capNeutralizedOut': "\(combat\) <.*?ff7fffff><b>([0-9]+).*>能量中和<",
-        'nosRecieved': "\(combat\) <.*?><b>\+([0-9]+).*>被从<",
-        'capTransferedIn': "\(combat\) <.*?><b>([0-9]+).*>远程电容传输量由<",
-        'capNeutralizedIn': "\(combat\) <.*?ffe57f7f><b>([0-9]+).*>能量中和<",
-        'nosTaken': "\(combat\) <.*?><b>\-([0-9]+).*>被吸取到<",
+        'damageOut': "\(combat\) <[^>]*><b>([0-9]+).*>对<",
+        'damageIn': "\(combat\) <[^>]*><b>([0-9]+).*>来自<",
+        'armorRepairedOut': "\(combat\) <[^>]*><b>([0-9]+).*>远程装甲维修量至<",
+        'hullRepairedOut': "\(combat\) <[^>]*><b>([0-9]+).*>远程结构维修量至<",
+        'shieldBoostedOut': "\(combat\) <[^>]*><b>([0-9]+).*>远程护盾回充增量至<",
+        'armorRepairedIn': "\(combat\) <[^>]*><b>([0-9]+).*>远程装甲维修量由<",
+        'hullRepairedIn': "\(combat\) <[^>]*><b>([0-9]+).*>远程结构维修量由<",
+        'shieldBoostedIn': "\(combat\) <[^>]*><b>([0-9]+).*>远程护盾回充增量由<",
+        'capTransferedOut': "\(combat\) <[^>]*><b>([0-9]+).*>远程电容传输至<",
+        'capNeutralizedOut': "\(combat\) <[^>]*ff7fffff><b>([0-9]+).*>能量中和<",
+        'nosRecieved': "\(combat\) <[^>]*><b>\+([0-9]+).*>被从<",
+        'capTransferedIn': "\(combat\) <[^>]*><b>([0-9]+).*>远程电容传输量由<",
+        'capNeutralizedIn': "\(combat\) <[^>]*ffe57f7f><b>([0-9]+).*>能量中和<",
+        'nosTaken': "\(combat\) <[^>]*><b>\-([0-9]+).*>被吸取到<",
         'mined': "\(mining\) .*<b><.*?><.*?>([0-9]+).*>个单位的.*<b>(.+)</b>"
         }
 }
 
+# the combat regex in the order they are tried, and which of the results each of them is added to:
+#  damageOut, damageIn, logisticsOut, logisticsIn, capTransfered, capRecieved, capDamageDone, capDamageRecieved
+#  a nos drains capacitor from the target into ours, so nos recieved is both cap recieved and cap damage done,
+#  it is matched once and the same entry is added to both
+_combatRegexResults = [('damageOut', (0,)), ('damageIn', (1,)),
+                       ('armorRepairedOut', (2,)), ('hullRepairedOut', (2,)), ('shieldBoostedOut', (2,)),
+                       ('armorRepairedIn', (3,)), ('hullRepairedIn', (3,)), ('shieldBoostedIn', (3,)),
+                       ('capTransferedOut', (4,)),
+                       ('capTransferedIn', (5,)), ('nosRecieved', (5, 6)),
+                       ('capNeutralizedOut', (6,)),
+                       ('capNeutralizedIn', (7,)), ('nosTaken', (7,))]
+
+# every combat regex starts with this
+_combatRegexPrefix = "\(combat\) <"
+
+# named groups of the pilotAndWeapon regex
+_detailGroupNames = ['default_pilot', 'pilot', 'default_ship', 'ship', 'default_weapon', 'weapon']
+_namedGroupRegex = re.compile('\(\?P<\w+>')
+
+# compiled regex, keyed by (language, pilotAndWeaponRegex)
+_compiledRegex = {}
+
+# logs are read in binary with a large buffer, and matched without being decoded
+_logBufferSize = 64 * 1024
+_logSeparator = b"------------------------------------------------------------"
+
 _logReaders = []
 
 class CharacterDetector(FileSystemEventHandler):
@@ -172,17 +200,25 @@ class CharacterDetector(FileSystemEventHandler):
             self.path = os.environ['HOME'] + "/Documents/EVE/logs/Gamelogs/"
         
         self.menuEntries = []
+        # index of each character in menuEntries (and logReaders)
+        self.menuEntryIndexes = {}
         self.logReaders = _logReaders
         self.selectedIndex = IntVar()
         self.playbackLogReader = None
         
         try:
             oneDayAgo = datetime.datetime.now() - datetime.timedelta(hours=24)
-            fileList = sorted(os.listdir(self.path), key=lambda file: os.stat(os.path.join(self.path, file)).st_mtime)
+            fileList = _listDirectory(self.path)
             for filename in fileList:
-                timeString = filename.strip(".txt")
+                # logs are named after the time they were started, as YYYYmmdd_HHMMSS.txt
+                #  this is parsed by slicing, as strptime is slow for the number of files that can be in here
+                timeString = filename[:-4]
+                if not (filename.endswith(".txt") and len(timeString) == 15 and timeString[8] == "_" and
+                        timeString[:8].isdigit() and timeString[9:].isdigit()):
+                    continue
                 try:
-                    fileTime = datetime.datetime.strptime(timeString, "%Y%m%d_%H%M%S")
+                    fileTime = datetime.datetime(int(timeString[0:4]), int(timeString[4:6]), int(timeString[6:8]),
+                                                 int(timeString[9:11]), int(timeString[11:13]), int(timeString[13:15]))
                 except ValueError:
                     continue
                 if (fileTime >= oneDayAgo):
@@ -225,14 +261,13 @@ class CharacterDetector(FileSystemEventHandler):
         if len(self.menuEntries) == 0:
             self.characterMenu.menu.delete(0)
         
-        for i in range(len(self.menuEntries)):
-            if (character == self.menuEntries[i]):
-                try:
-                    newLogReader = LogReader(logPath, self.mainWindow)
-                except BadLogException:
-                    return
-                self.logReaders[i] = newLogReader
+        if character in self.menuEntryIndexes:
+            try:
+                newLogReader = LogReader(logPath, self.mainWindow)
+            except BadLogException:
                 return
+            self.logReaders[self.menuEntryIndexes[character]] = newLogReader
+            return
         
         try:
             newLogReader = LogReader(logPath, self.mainWindow)
@@ -241,6 +276,7 @@ class CharacterDetector(FileSystemEventHandler):
         self.logReaders.append(newLogReader)
         self.characterMenu.menu.insert_radiobutton(0, label=character, variable=self.selectedIndex, 
                                                 value=len(self.menuEntries), command=self.catchupLog)
+        self.menuEntryIndexes[character] = len(self.menuEntries)
         self.menuEntries.append(character)
         
     def stop(self):
@@ -325,81 +361,75 @@ class BaseLogReader():
         overviewSettings = settings.getOverviewSettings(self.character)
         pilotAndWeaponRegex = self.createOverviewRegex(overviewSettings) or basicPilotAndWeaponRegex
 
-        self.damageOutRegex = re.compile(_logLanguageRegex[self.language]['damageOut'] + basicPilotAndWeaponRegex)
-        
-        self.damageInRegex = re.compile(_logLanguageRegex[self.language]['damageIn'] + basicPilotAndWeaponRegex)
-        
-        self.armorRepairedOutRegex = re.compile(_logLanguageRegex[self.language]['armorRepairedOut'] + pilotAndWeaponRegex)
-        self.hullRepairedOutRegex = re.compile(_logLanguageRegex[self.language]['hullRepairedOut'] + pilotAndWeaponRegex)
-        self.shieldBoostedOutRegex = re.compile(_logLanguageRegex[self.language]['shieldBoostedOut'] + pilotAndWeaponRegex)
-        
-        self.armorRepairedInRegex = re.compile(_logLanguageRegex[self.language]['armorRepairedIn']+ pilotAndWeaponRegex)
-        self.hullRepairedInRegex = re.compile(_logLanguageRegex[self.language]['hullRepairedIn'] + pilotAndWeaponRegex)
-        self.shieldBoostedInRegex = re.compile(_logLanguageRegex[self.language]['shieldBoostedIn'] + pilotAndWeaponRegex)
-        
-        self.capTransferedOutRegex = re.compile(_logLanguageRegex[self.language]['capTransferedOut'] + pilotAndWeaponRegex)
-        
-        self.capNeutralizedOutRegex = re.compile(_logLanguageRegex[self.language]['capNeutralizedOut'] + pilotAndWeaponRegex)
-        self.nosRecievedRegex = re.compile(_logLanguageRegex[self.language]['nosRecieved'] + pilotAndWeaponRegex)
-        
-        self.capTransferedInRegex = re.compile(_logLanguageRegex[self.language]['capTransferedIn'] + pilotAndWeaponRegex)
-        #add nos recieved to this group in readlog
-        
-        self.capNeutralizedInRegex = re.compile(_logLanguageRegex[self.language]['capNeutralizedIn'] + pilotAndWeaponRegex)
-        self.nosTakenRegex = re.compile(_logLanguageRegex[self.language]['nosTaken'] + pilotAndWeaponRegex)
-        
-        self.minedRegex = re.compile(_logLanguageRegex[self.language]['mined'])
+        # compiled regex are shared between every reader with the same language and overview settings,
+        #  so a new log file for a character doesn't have to recompile them
+        cacheKey = (self.language, pilotAndWeaponRegex)
+        if cacheKey not in _compiledRegex:
+            languageRegex = _logLanguageRegex[self.language]
+            # all combat regex are joined into one pattern so the log only needs to be scanned once,
+            #  each one is wrapped in a group with its own name so we know which one matched
+            # their shared prefix is matched once in front of the group, this lets the regex engine
+            #  skip ahead to the next combat line instead of trying every group at every character
+            # Python 3.4 and older only allow 100 groups in a pattern, so the pilot, ship and weapon groups
+            #  are left out of the joined pattern, each matched line is matched again by its own regex for them
+            combatRegex = []
+            combatGroups = {}
+            for name, resultIndexes in _combatRegexResults:
+                regex = languageRegex[name]
+                if not regex.startswith(_combatRegexPrefix):
+                    raise ValueError(self.language + " " + name + " regex doesn't start with " + _combatRegexPrefix)
+                if name in ['damageOut', 'damageIn']:
+                    regex += basicPilotAndWeaponRegex
+                else:
+                    regex += pilotAndWeaponRegex
+                # logs are matched as bytes, so the patterns are too
+                detailRegex = re.compile(regex.encode('utf8'))
+                # the amount is the first group, followed by the pilot, ship and weapon groups
+                groups = [1] + [detailRegex.groupindex[group] for group in _detailGroupNames]
+                combatGroups[name] = (resultIndexes, detailRegex, groups)
+                regex = _namedGroupRegex.sub('(?:', regex[len(_combatRegexPrefix):])
+                combatRegex.append('(?P<' + name + '>' + regex + ')')
+            combinedRegex = re.compile((_combatRegexPrefix + '(?:' + '|'.join(combatRegex) + ')').encode('utf8'))
+            
+            _compiledRegex[cacheKey] = {'combat': combinedRegex, 'combatGroups': combatGroups,
+                                        'mined': re.compile(languageRegex['mined'].encode('utf8'))}
+        self.regex = _compiledRegex[cacheKey]
         
     def readLog(self, logData):
-        damageOut = self.extractValues(self.damageOutRegex, logData)
-        damageIn = self.extractValues(self.damageInRegex, logData)
-        logisticsOut = self.extractValues(self.armorRepairedOutRegex, logData)
-        logisticsOut.extend(self.extractValues(self.hullRepairedOutRegex, logData))
-        logisticsOut.extend(self.extractValues(self.shieldBoostedOutRegex, logData))
-        logisticsIn = self.extractValues(self.armorRepairedInRegex, logData)
-        logisticsIn.extend(self.extractValues(self.hullRepairedInRegex, logData))
-        logisticsIn.extend(self.extractValues(self.shieldBoostedInRegex, logData))
-        capTransfered = self.extractValues(self.capTransferedOutRegex, logData)
-        capRecieved = self.extractValues(self.capTransferedInRegex, logData)
-        capRecieved.extend(self.extractValues(self.nosRecievedRegex, logData))
-        capDamageDone = self.extractValues(self.capNeutralizedOutRegex, logData)
-        capDamageDone.extend(self.extractValues(self.nosRecievedRegex, logData))
-        capDamageRecieved = self.extractValues(self.capNeutralizedInRegex, logData)
-        capDamageRecieved.extend(self.extractValues(self.nosTakenRegex, logData))
-        mined = self.extractValues(self.minedRegex, logData, mining=True)
-                
-        return damageOut, damageIn, logisticsOut, logisticsIn, capTransfered, capRecieved, capDamageDone, capDamageRecieved, mined
+        """ logData must only be the log entries that are new since the last call """
+        # most ticks have nothing new in the log
+        if not logData:
+            return _emptyResult
+        results = [[] for x in range(0,8)]
+        combatGroups = self.regex['combatGroups']
+        for match in self.regex['combat'].finditer(logData):
+            resultIndexes, detailRegex, groups = combatGroups[match.lastgroup]
+            details = detailRegex.match(logData, match.start(), match.end())
+            amount, defaultPilot, pilot, defaultShip, ship, defaultWeapon, weapon = details.group(*groups)
+            # only the names that are kept get decoded
+            pilotName = (defaultPilot or pilot or b'?').decode('utf8', 'replace')
+            shipType = ship or defaultShip
+            weaponType = defaultWeapon or weapon
+            entry = {'amount': int(amount),
+                     'pilotName': pilotName.strip(),
+                     'shipType': shipType.decode('utf8', 'replace') if shipType else pilotName,
+                     'weaponType': weaponType.decode('utf8', 'replace') if weaponType else 'Unknown'}
+            for index in resultIndexes:
+                results[index].append(entry)
+        results.append(self.extractMiningValues(self.regex['mined'], logData))
+        return results
     
-    def extractValues(self, regex, logData, mining=False):
+    def extractMiningValues(self, regex, logData):
         returnValue = []
-        group = regex.finditer(logData)
-        if mining:
-            for match in group:
-                amount = match.group(1)
-                _type = match.group(2)
-                if amount != 0:
-                    returnGroup = {}
-                    if settings.getMiningM3Setting():
-                        if _type in _oreVolume:
-                            returnGroup['amount'] = int(amount) * _oreVolume[_type]
-                        else:
-                            returnGroup['amount'] = int(amount)
-                    else:
-                        returnGroup['amount'] = int(amount)
-                    returnValue.append(returnGroup)
-            return returnValue
-        for match in group:
-            amount = match.group(1) or 0
-            pilotName = match.group('default_pilot') or match.group('pilot') or '?'
-            shipType = match.group('ship') or match.group('default_ship') or pilotName
-            weaponType = match.group('default_weapon') or match.group('weapon') or 'Unknown'
-            if amount != 0:
-                returnGroup = {}
-                returnGroup['amount'] = int(amount)
-                returnGroup['pilotName'] = pilotName.strip()
-                returnGroup['shipType'] = shipType
-                returnGroup['weaponType'] = weaponType
-                returnValue.append(returnGroup)
+        # this setting doesn't change mid-scan, so only look it up once
+        showM3 = settings.getMiningM3Setting()
+        for match in regex.finditer(logData):
+            amount, _type = match.group(1, 2)
+            _type = _type.decode('utf8', 'replace')
+            if showM3 and _type in _oreVolume:
+                returnValue.append({'amount': int(amount) * _oreVolume[_type]})
+            else:
+                returnValue.append({'amount': int(amount)})
         return returnValue
     
 class PlaybackLogReader(BaseLogReader):
@@ -410,13 +440,13 @@ class PlaybackLogReader(BaseLogReader):
         self.paused = False
         self.logPath = logPath
         try:
-            self.log = open(logPath, 'r', encoding="utf8")
+            self.log = open(logPath, 'rb', buffering=_logBufferSize)
             self.log.readline()
             self.log.readline()
         except:
             messagebox.showerror("Error", "This doesn't appear to be a EVE log file.\nPlease select a different file.")
             raise BadLogException("not character log")
-        characterLine = self.log.readline()
+        characterLine = _readHeaderLine(self.log)
         try:
             self.character, self.language = ProcessCharacterLine(characterLine)
         except BadLogException:
@@ -425,13 +455,13 @@ class PlaybackLogReader(BaseLogReader):
         logging.info('Log language is ' + self.language)
         
         startTimeRegex = _logLanguageRegex[self.language]['sessionTime']
-        self.startTimeLog = datetime.datetime.strptime(re.search(startTimeRegex, self.log.readline()).group(0), "%Y.%m.%d %X")
+        self.startTimeLog = datetime.datetime.strptime(re.search(startTimeRegex, _readHeaderLine(self.log)).group(0), "%Y.%m.%d %X")
 
         self.log.readline()
         self.logLine = self.log.readline()
-        while (self.logLine == "------------------------------------------------------------\n"):
+        while (self.logLine.rstrip() == _logSeparator):
             self.log.readline()
-            collisionCharacter, language = ProcessCharacterLine(self.log.readline())
+            collisionCharacter, language = ProcessCharacterLine(_readHeaderLine(self.log))
             #Since we currently don't have a use for characters during playback, this is not needed for now.
             #messagebox.showerror("Error", "Log file collision on characters:\n\n" + character + " and " + collisionCharacter +
             #                    "\n\nThis happens when both characters log in at exactly the same second.\n" + 
@@ -440,88 +470,90 @@ class PlaybackLogReader(BaseLogReader):
             self.log.readline()
             self.log.readline()
             self.logLine = self.log.readline()
-        self.timeRegex = re.compile("^\[ .*? \]")
-        self.nextLine = self.logLine
-        self.nextTime = datetime.datetime.strptime(self.timeRegex.findall(self.nextLine)[0], "[ %Y.%m.%d %X ]")
         self.startTimeDelta = datetime.datetime.utcnow() - self.startTimeLog
         
+        # the log doesn't change during playback, so it is mapped into memory and the log data
+        #  for each tick is sliced straight out of the mapping
+        logFile = self.log
+        self.log = mmap.mmap(logFile.fileno(), 0, access=mmap.ACCESS_READ)
+        logFile.close()
+        
         self.compileRegex()
         
-        #inefficient, but ok for our normal log size
-        endOfLog = open(logPath, 'r', encoding="utf8")
-        line = endOfLog.readline()
-        while ( line != '' ):
-            line = endOfLog.readline()
+        # a single pass over the log indexes the time and position of every entry,
+        #  so reads and seeks can look up where to stop instead of parsing the log again
+        self.entryTimes = []
+        self.entryPositions = []
+        # this runs for every line in the log, so the lookups it needs are bound to locals once up front
+        newDatetime = datetime.datetime
+        appendTime = self.entryTimes.append
+        appendPosition = self.entryPositions.append
+        lineEnd = 0
+        for line in iter(self.log.readline, b""):
+            lineStart = lineEnd
+            lineEnd += len(line)
+            # entries start with a timestamp in a fixed layout, "[ YYYY.mm.dd HH:MM:SS ]",
+            #  so its fields are sliced out instead of using a regex and strptime
+            if line[:2] != b"[ " or line[21:23] != b" ]":
+                continue
             try:
-                nextTimeString = self.timeRegex.findall(line)[0]
-            except IndexError:
+                entryTime = newDatetime(int(line[2:6]), int(line[7:9]), int(line[10:12]),
+                                        int(line[13:15]), int(line[16:18]), int(line[19:21]))
+            except ValueError:
                 continue
-            self.endTimeLog = datetime.datetime.strptime(nextTimeString, "[ %Y.%m.%d %X ]")
-        endOfLog.close()
-        
-        endOfLog = open(logPath, 'r', encoding="utf8")
-        line = endOfLog.readline()
-        self.logEntryFrequency = [0] * (self.endTimeLog - self.startTimeLog).seconds
-        while ( line != '' ):
-            line = endOfLog.readline()
+            appendTime(entryTime)
+            appendPosition(lineStart)
+        self.endTimeLog = self.entryTimes[-1]
+        self.nextLineStart = self.entryPositions[0]
+        
+        startTimeLog = self.startTimeLog
+        logEntryFrequency = [0] * (self.endTimeLog - startTimeLog).seconds
+        for entryTime in self.entryTimes:
             try:
-                nextTimeString = self.timeRegex.findall(line)[0]
-                entryTime = datetime.datetime.strptime(nextTimeString, "[ %Y.%m.%d %X ]")
-                self.logEntryFrequency[(entryTime - self.startTimeLog).seconds] += 1
+                logEntryFrequency[(entryTime - startTimeLog).seconds] += 1
             except IndexError:
                 continue
-        endOfLog.close()
-        
+        self.logEntryFrequency = logEntryFrequency
         
     def newStartTime(self, newTime):
-        self.log.close()
-        self.log = open(self.logPath, 'r', encoding="utf8")
         self.startTimeDelta = datetime.datetime.utcnow() - newTime
-        self.nextTime = self.startTimeLog
-        while ( self.nextTime < newTime ):
-            line = self.log.readline()
-            try:
-                nextTimeString = self.timeRegex.findall(line)[0]
-            except IndexError:
-                continue
-            self.nextTime = datetime.datetime.strptime(nextTimeString, "[ %Y.%m.%d %X ]")
-            self.nextLine = line
+        nextEntry = bisect.bisect_left(self.entryTimes, newTime)
+        if nextEntry < len(self.entryPositions):
+            self.nextLineStart = self.entryPositions[nextEntry]
+        else:
+            self.nextLineStart = len(self.log)
         
     def readLog(self):
         if self.paused:
             return _emptyResult
-        logData = ""
         logReaderTime = datetime.datetime.utcnow() - self.startTimeDelta
         self.mainWindow.playbackFrame.timeSlider.set((logReaderTime - self.startTimeLog).seconds)
-        while ( self.nextTime < logReaderTime ):
-            logData += self.nextLine
-            self.nextLine = self.log.readline()
-            if (self.nextLine == ''):
-                self.mainWindow.playbackFrame.pauseButtonRelease(None)
-                return _emptyResult
-            try:
-                nextTimeString = self.timeRegex.findall(self.nextLine)[0]
-            except IndexError:
-                continue
-            self.nextTime = datetime.datetime.strptime(nextTimeString, "[ %Y.%m.%d %X ]")
-        return super().readLog(logData)
+        # every entry from before logReaderTime is due
+        nextEntry = bisect.bisect_left(self.entryTimes, logReaderTime)
+        if nextEntry == len(self.entryTimes):
+            self.mainWindow.playbackFrame.pauseButtonRelease(None)
+            return _emptyResult
+        # the log data is every line from where the last read stopped, up to the first entry that isn't due yet
+        logDataStart = self.nextLineStart
+        self.nextLineStart = self.entryPositions[nextEntry]
+        return super().readLog(self.log[logDataStart:self.nextLineStart])
         
         
 class LogReader(BaseLogReader):
     def __init__(self, logPath, mainWindow):
         super().__init__(logPath, mainWindow)
-        self.log = open(logPath, 'r', encoding="utf8")
+        self.log = open(logPath, 'rb', buffering=_logBufferSize)
         self.log.readline()
         self.log.readline()
-        characterLine = self.log.readline()
+        characterLine = _readHeaderLine(self.log)
         self.character, self.language = ProcessCharacterLine(characterLine)
         logging.info('Log language is ' + self.language)
         self.log.readline()
         self.log.readline()
         self.logLine = self.log.readline()
-        if (self.logLine == "------------------------------------------------------------\n"):
+        if (self.logLine.rstrip() == _logSeparator):
             self.log.readline()
-            collisionCharacter, language = ProcessCharacterLine(self.log.readline())
+            collisionCharacter, language = ProcessCharacterLine(_readHeaderLine(self.log))
             logging.error('Log file collision on characters' + self.character + " and " + collisionCharacter)
             messagebox.showerror("Error", "Log file collision on characters:\n\n" + self.character + " and " + collisionCharacter +
                                 "\n\nThis happens when both characters log in at exactly the same second.\n" + 
@@ -529,19 +561,41 @@ class LogReader(BaseLogReader):
                                 "Please restart the client of the character you want to track to use this program.\n" + 
                                 "If you already did, you can ignore this message, or delete this log file:\n" + logPath)
             raise BadLogException("log file collision")
-        self.log.read()
+        # skip to the end of the log without reading in everything that happened before
+        self.log.seek(0, os.SEEK_END)
+        self.partialLine = b""
         self.compileRegex()
             
     def readLog(self):
-        logData = self.log.read()
-        return super().readLog(logData)
+        # the file position is kept between reads, so this is only what was added since the last read
+        logData = self.partialLine + self.log.read()
+        # EVE can be part way through writing a line, hold on to it until the rest of it is read
+        endOfLastLine = logData.rfind(b"\n") + 1
+        self.partialLine = logData[endOfLastLine:]
+        return super().readLog(logData[:endOfLastLine])
     
     def catchup(self):
-        self.log.read()
+        self.log.seek(0, os.SEEK_END)
+        self.partialLine = b""
     
 class BadLogException(Exception):
     pass
 
+def _listDirectory(path):
+    """ returns the names of the files in path, oldest modified first """
+    # scandir entries cache their stat results, so each file is only stat'ed once
+    #  it was added in Python 3.5, so older versions stat every file themselves
+    if hasattr(os, 'scandir'):
+        files = [(entry.stat().st_mtime, entry.name) for entry in os.scandir(path)]
+    else:
+        files = [(os.stat(os.path.join(path, filename)).st_mtime, filename) for filename in os.listdir(path)]
+    return [filename for modifiedTime, filename in sorted(files, key=lambda file: file[0])]
+
+def _readHeaderLine(log):
+    """ reads a line of the log header, decoded and without the line ending """
+    # a file that isn't a log can have anything in it, this is caught by the header not matching instead
+    return log.readline().decode('utf8', 'replace').rstrip('\r\n')
+
 def ProcessCharacterLine(characterLine):
     for language, regex in _logLanguageRegex.items():
         character = re.search(regex['character'], characterLine)